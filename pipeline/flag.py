@@ -7,6 +7,7 @@ Sets item["flagged"] = True and item["flag_reasons"] = [list of matched keywords
 
 import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +22,14 @@ def apply(items: list[dict], config: dict) -> list[dict]:
             item["flag_reasons"] = []
         return items
 
-    # Build one pattern per keyword for readable match reporting
-    compiled = [(kw, re.compile(r"\b" + re.escape(kw) + r"\b", re.IGNORECASE)) for kw in keywords]
+    pattern, implied = _build_matcher(tuple(keywords))
 
     flagged_count = 0
     for item in items:
-        searchable = " ".join([
-            item.get("title", ""),
-            item.get("description", ""),
-            item.get("address", ""),
-        ])
-        reasons = [kw for kw, pat in compiled if pat.search(searchable)]
+        searchable = item.get("_search") or (
+            f"{item.get('title', '')} {item.get('description', '')} {item.get('address', '')}"
+        )
+        reasons = _match_keywords(searchable, pattern, implied, keywords)
         item["flagged"] = bool(reasons)
         item["flag_reasons"] = reasons
         if reasons:
@@ -40,3 +38,45 @@ def apply(items: list[dict], config: dict) -> list[dict]:
 
     logger.info("Flagging: %d of %d items flagged", flagged_count, len(items))
     return items
+
+
+# ── Keyword matching ──────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=4)
+def _build_matcher(keywords: tuple[str, ...]):
+    """
+    Compile every keyword into one pattern so each item is scanned once.
+
+    The alternation sits inside a lookahead, so a match is attempted at every
+    position and overlapping keywords ("public comment" / "comment period")
+    are all found. Longest keywords are tried first; `implied` maps each
+    keyword to the shorter keywords it contains ("conditional use permit"
+    contains "conditional use"), which the lookahead would otherwise shadow.
+    """
+    unique = list(dict.fromkeys(kw.lower() for kw in keywords))
+    by_length = sorted(unique, key=len, reverse=True)
+    pattern = re.compile(
+        r"(?=\b(" + "|".join(re.escape(kw) for kw in by_length) + r")\b)",
+        re.IGNORECASE,
+    )
+
+    implied: dict[str, set[str]] = {}
+    for kw in unique:
+        implied[kw] = {
+            other for other in unique
+            if other != kw and re.search(r"\b" + re.escape(other) + r"\b", kw)
+        }
+    return pattern, implied
+
+
+def _match_keywords(text: str, pattern, implied: dict, keywords: list[str]) -> list[str]:
+    """Return the configured keywords found in text, in config order."""
+    found: set[str] = set()
+    for m in pattern.finditer(text):
+        kw = m.group(1).lower()
+        if kw not in found:
+            found.add(kw)
+            found |= implied.get(kw, set())
+    if not found:
+        return []
+    return [kw for kw in keywords if kw.lower() in found]
@@ -7,10 +7,11 @@ Writes output to docs/index.html (GitHub Pages root).
 
 import logging
 import os
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 logger = logging.getLogger(__name__)
 
@@ -18,54 +19,56 @@ TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 OUTPUT_DIR = Path(__file__).parent.parent / "docs"
 OUTPUT_FILE = OUTPUT_DIR / "index.html"
 
+# One shared environment: the template is parsed and compiled once per process,
+# and the compiled bytecode is cached in the system temp dir across runs.
+_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
 
 def build(items: list[dict], config: dict) -> Path:
     """Render the dashboard and write to docs/index.html. Returns output path."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATE_DIR)),
-        autoescape=select_autoescape(["html"]),
-    )
-    template = env.get_template("dashboard.html")
+    template = _ENV.get_template("dashboard.html")
 
-    # Sort: flagged first, then by date descending
-    sorted_items = sorted(
-        items,
-        key=lambda x: (not x.get("flagged", False), x.get("date", "") or ""),
-        reverse=False,
-    )
-    # Within the sorted list, date should be newest-first within each flagged group
-    flagged = sorted(
-        [i for i in sorted_items if i.get("flagged")],
-        key=lambda x: x.get("date", ""),
-        reverse=True,
-    )
-    unflagged = sorted(
-        [i for i in sorted_items if not i.get("flagged")],
-        key=lambda x: x.get("date", ""),
-        reverse=True,
-    )
-    ordered_items = flagged + unflagged
+    # One pass: partition flagged/unflagged and gather dropdown values and stats
+    flagged: list[dict] = []
+    unflagged: list[dict] = []
+    sources: set[str] = set()
+    categories: set[str] = set()
+    category_counts: Counter[str] = Counter()
+    for item in items:
+        (flagged if item.get("flagged") else unflagged).append(item)
+        source = item.get("source")
+        if source:
+            sources.add(source)
+        category = item.get("category")
+        if category:
+            categories.add(category)
+            category_counts[category] += 1
 
-    # Gather unique sources and categories for filter dropdowns
-    sources = sorted({i.get("source", "") for i in ordered_items if i.get("source")})
-    categories = sorted({i.get("category", "") for i in ordered_items if i.get("category")})
+    # Flagged first, then newest-first within each group
+    flagged.sort(key=lambda x: x.get("date", ""), reverse=True)
+    unflagged.sort(key=lambda x: x.get("date", ""), reverse=True)
+    ordered_items = flagged + unflagged
 
-    # Stats
     stats = {
         "total": len(ordered_items),
-        "permits": sum(1 for i in ordered_items if i.get("category") == "permit"),
-        "hearings": sum(1 for i in ordered_items if i.get("category") == "hearing"),
-        "roads": sum(1 for i in ordered_items if i.get("category") == "road"),
-        "funding": sum(1 for i in ordered_items if i.get("category") == "funding"),
+        "permits": category_counts["permit"],
+        "hearings": category_counts["hearing"],
+        "roads": category_counts["road"],
+        "funding": category_counts["funding"],
     }
 
     now_utc = datetime.now(timezone.utc)
-    rendered = template.render(
+    stream = template.stream(
         items=ordered_items,
-        sources=sources,
-        categories=categories,
+        sources=sorted(sources),
+        categories=sorted(categories),
         stats=stats,
         config=config,
         last_updated=now_utc.strftime("%B %d, %Y at %I:%M %p UTC"),
@@ -74,6 +77,12 @@ def build(items: list[dict], config: dict) -> Path:
         dashboard=config.get("dashboard", {}),
     )
 
-    OUTPUT_FILE.write_text(rendered, encoding="utf-8")
+    # Stream straight to disk rather than holding the whole page in memory.
+    # Render into a temp file first so a template error mid-render leaves the
+    # existing dashboard untouched.
+    tmp_file = OUTPUT_FILE.with_suffix(".html.tmp")
+    with tmp_file.open("w", encoding="utf-8") as f:
+        stream.dump(f)
+    os.replace(tmp_file, OUTPUT_FILE)
     logger.info("Dashboard written to %s (%d items)", OUTPUT_FILE, len(ordered_items))
     return OUTPUT_FILE
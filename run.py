@@ -11,6 +11,7 @@ Usage:
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -58,15 +59,22 @@ def main():
     logger.info("Config loaded — %d flag keywords", len(config.get("flag_keywords", [])))
 
     # ── Step 1: Fetch ─────────────────────────────────────────────────────────
+    # Scrapers are network-bound and independent, so run them concurrently.
+    # Results are collected in registry order to keep the output stable.
     all_items: list[dict] = []
-    for name, fetch_fn in SCRAPERS.items():
-        logger.info("Running scraper: %s", name)
-        try:
-            items = fetch_fn(config)
-            logger.info("  → %d items from %s", len(items), name)
-            all_items.extend(items)
-        except Exception as e:
-            logger.error("Scraper %s failed: %s", name, e, exc_info=True)
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        futures = {}
+        for name, fetch_fn in SCRAPERS.items():
+            logger.info("Running scraper: %s", name)
+            futures[name] = executor.submit(fetch_fn, config)
+
+        for name, future in futures.items():
+            try:
+                items = future.result()
+                logger.info("  → %d items from %s", len(items), name)
+                all_items.extend(items)
+            except Exception as e:
+                logger.error("Scraper %s failed: %s", name, e, exc_info=True)
 
     logger.info("Total fetched: %d items", len(all_items))
 
@@ -90,6 +98,13 @@ def main():
             deduped.append(item)
     logger.info("After dedup: %d items", len(deduped))
 
+    # Build each item's lowercased search text once; flagging and the
+    # dashboard's client-side search both read it.
+    for item in deduped:
+        item["_search"] = (
+            f"{item.get('title', '')} {item.get('description', '')} {item.get('address', '')}"
+        ).lower()
+
     # ── Step 3: Filter ────────────────────────────────────────────────────────
     filtered = geo_filter.apply(deduped, config)
 
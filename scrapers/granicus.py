@@ -12,15 +12,18 @@ Strategy:
 Returns one item per meeting.
 """
 
+import io
 import logging
 import re
-import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,12 @@ HEADERS = {
     )
 }
 
+# Shared session so the RSS and listing requests reuse pooled keep-alive
+# connections to the same host instead of each paying a fresh TLS handshake.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 def fetch(config: dict) -> list[dict]:
     cfg = config["sources"]["granicus"]
@@ -40,8 +49,15 @@ def fetch(config: dict) -> list[dict]:
     items: list[dict] = []
     seen_clip_ids: set[str] = set()
 
+    # The RSS feed and listing page are independent requests — fetch both at
+    # once. Listing rows can only be parsed once the RSS clip IDs are known.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rss_future = executor.submit(_fetch_rss, cfg)
+        listing_future = executor.submit(_fetch_listing_page, cfg)
+        rss_items = rss_future.result()
+        listing_html = listing_future.result()
+
     # ── 1. RSS feed ───────────────────────────────────────────────────────────
-    rss_items = _fetch_rss(cfg)
     for item in rss_items:
         clip_id = _clip_id_from_url(item["url"])
         if clip_id:
@@ -49,7 +65,9 @@ def fetch(config: dict) -> list[dict]:
         items.append(item)
 
     # ── 2. HTML listing page — upcoming meetings not yet in the RSS feed ──────
-    html_items = _scrape_listing(cfg, seen_clip_ids)
+    html_items = []
+    if listing_html is not None:
+        html_items = _scrape_listing(listing_html, cfg, seen_clip_ids)
     items.extend(html_items)
 
     logger.info("Granicus: %d total items (%d from RSS, %d from listing page)",
@@ -62,28 +80,32 @@ def fetch(config: dict) -> list[dict]:
 def _fetch_rss(cfg: dict) -> list[dict]:
     url = cfg["rss_url"]
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
     except requests.RequestException as e:
         logger.error("Granicus RSS error: %s", e)
         return []
 
+    # Walk the feed incrementally, clearing each <item> once parsed, so the
+    # full element tree is never built.
+    items = []
     try:
-        root = ET.fromstring(resp.content)
-    except ET.ParseError as e:
+        for _, entry in etree.iterparse(
+            io.BytesIO(resp.content), events=("end",), tag="item",
+            resolve_entities=False,
+        ):
+            parent = entry.getparent()
+            if parent is not None and parent.tag == "channel":
+                item = _parse_rss_item(entry, cfg)
+                if item:
+                    items.append(item)
+            entry.clear()
+            while parent is not None and entry.getprevious() is not None:
+                del parent[0]
+    except etree.XMLSyntaxError as e:
         logger.error("Granicus RSS parse error: %s", e)
         return []
 
-    channel = root.find("channel")
-    if channel is None:
-        return []
-
-    items = []
-    for entry in channel.findall("item"):
-        item = _parse_rss_item(entry, cfg)
-        if item:
-            items.append(item)
-
     logger.info("Granicus RSS: parsed %d items", len(items))
     return items
 
@@ -131,22 +153,35 @@ def _parse_rss_item(entry, cfg: dict) -> dict | None:
 
 # ── HTML listing page ─────────────────────────────────────────────────────────
 
-def _scrape_listing(cfg: dict, already_seen: set[str]) -> list[dict]:
-    """Scrape the main listing page for meetings not yet in the RSS feed."""
+# Granicus listing tables use class "listingTable" with rows "listingRow"
+_LISTING_ROW_RE = re.compile(r"listingRow", re.I)
+
+
+def _fetch_listing_page(cfg: dict) -> bytes | None:
+    """Fetch the main listing page HTML. Returns None on error."""
     url = cfg["listing_url"]
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
     except requests.RequestException as e:
         logger.error("Granicus listing page error: %s", e)
-        return []
+        return None
+    return resp.content
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+
+def _scrape_listing(html: bytes, cfg: dict, already_seen: set[str]) -> list[dict]:
+    """Parse the main listing page for meetings not yet in the RSS feed."""
+    url = cfg["listing_url"]
+    # Raw bytes go straight to the C-backed lxml parser, which detects the
+    # page encoding itself.
+    soup = BeautifulSoup(html, "lxml")
     items = []
+    # Meetings already emitted — seeded with the RSS clip IDs, then grown as
+    # rows are accepted so repeated rows are dropped before any text work.
+    seen = set(already_seen)
 
-    # Granicus listing tables use class "listingTable" with rows "listingRow"
-    for row in soup.find_all("tr", class_=re.compile(r"listingRow", re.I)):
-        item = _parse_listing_row(row, url, cfg, already_seen)
+    for row in soup.find_all("tr", class_=_LISTING_ROW_RE):
+        item = _parse_listing_row(row, url, cfg, seen)
         if item:
             items.append(item)
 
@@ -154,7 +189,7 @@ def _scrape_listing(cfg: dict, already_seen: set[str]) -> list[dict]:
     if not items:
         for table in soup.find_all("table"):
             for row in table.find_all("tr"):
-                item = _parse_listing_row(row, url, cfg, already_seen)
+                item = _parse_listing_row(row, url, cfg, seen)
                 if item:
                     items.append(item)
 
@@ -162,7 +197,9 @@ def _scrape_listing(cfg: dict, already_seen: set[str]) -> list[dict]:
     return items
 
 
-def _parse_listing_row(row, base_url: str, cfg: dict, already_seen: set[str]) -> dict | None:
+def _parse_listing_row(row, base_url: str, cfg: dict, seen: set[str]) -> dict | None:
+    """Build an item for one listing row, or None if it has no agenda link or
+    its meeting is already in `seen`. Accepted meetings are added to `seen`."""
     # Look for an agenda link in this row
     agenda_link = None
     for a in row.find_all("a", href=True):
@@ -180,10 +217,11 @@ def _parse_listing_row(row, base_url: str, cfg: dict, already_seen: set[str]) ->
     elif not agenda_link.startswith("http"):
         agenda_link = urljoin(base_url, agenda_link)
 
-    # Skip if we already have this meeting from the RSS feed
-    clip_id = _clip_id_from_url(agenda_link)
-    if clip_id and clip_id in already_seen:
+    # Skip if we already have this meeting from the RSS feed or an earlier row
+    meeting_key = _clip_id_from_url(agenda_link) or agenda_link
+    if meeting_key in seen:
         return None
+    seen.add(meeting_key)
 
     # Extract date / title from row text
     row_text = row.get_text(separator=" ", strip=True)
@@ -211,13 +249,17 @@ def _parse_listing_row(row, base_url: str, cfg: dict, already_seen: set[str]) ->
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Display date in a meeting title, e.g. "Feb 20, 2026"
+_MONTH_DATE_RE = re.compile(
+    r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s*\d{4}",
+    re.IGNORECASE,
+)
+
+
 def _format_title(raw: str, canceled: bool, special: bool) -> str:
     """Build a clean display title."""
     # Extract the date portion if present (e.g. "Feb 20, 2026")
-    date_match = re.search(
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+\d{1,2},?\s*\d{4}",
-        raw, re.IGNORECASE
-    )
+    date_match = _MONTH_DATE_RE.search(raw)
     date_part = date_match.group(0) if date_match else None
 
     if date_part:
@@ -249,35 +291,74 @@ def _date_from_pubdate(raw: str) -> str | None:
         return None
 
 
+# All date shapes seen in Granicus titles and row text, fused into one pattern
+# so the text is scanned once. The matching group name picks the formats.
+_DATE_RE = re.compile(
+    # "Feb 20, 2026" or "February 20, 2026"
+    r"(?P<mdy>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{1,2},?\s*\d{4})"
+    # "20 February 2026"
+    r"|(?P<dmy>\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})"
+    # ISO "2026-02-20"
+    r"|(?P<iso>\d{4}-\d{2}-\d{2})"
+    # "MM/DD/YYYY"
+    r"|(?P<slash>\d{1,2}/\d{1,2}/\d{4})",
+    re.IGNORECASE,
+)
+# strptime formats for the month-name shapes; numeric shapes are built directly
+_DATE_FORMATS = {
+    "mdy":   ["%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y", "%b. %d, %Y"],
+    "dmy":   ["%d %B %Y"],
+}
+
+
 def _date_from_text(text: str) -> str | None:
-    """Try several date patterns found in Granicus titles and row text."""
-    patterns = [
-        # "Feb 20, 2026" or "February 20, 2026"
-        (r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{1,2},?\s*\d{4})",
-         ["%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y", "%b. %d, %Y"]),
-        # "20 February 2026"
-        (r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-         ["%d %B %Y"]),
-        # ISO "2026-02-20"
-        (r"(\d{4}-\d{2}-\d{2})",
-         ["%Y-%m-%d"]),
-        # "MM/DD/YYYY"
-        (r"(\d{1,2}/\d{1,2}/\d{4})",
-         ["%m/%d/%Y"]),
-    ]
-    for pat, fmts in patterns:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            raw = m.group(1).strip().rstrip(",")
-            for fmt in fmts:
-                try:
-                    return datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
+    """Return the first parseable date found in Granicus titles and row text."""
+    for m in _DATE_RE.finditer(text):
+        raw = m.group(0).strip().rstrip(",")
+        if m.lastgroup in ("iso", "slash"):
+            parsed = _numeric_date(raw, m.lastgroup)
+            if parsed:
+                return parsed
+            continue
+        fmts = _DATE_FORMATS[m.lastgroup]
+        if m.lastgroup == "mdy":
+            fmts = _order_mdy_formats(raw, fmts)
+        for fmt in fmts:
+            try:
+                return datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
+            except ValueError:
+                continue
     return None
 
 
+def _order_mdy_formats(raw: str, fmts: list[str]) -> list[str]:
+    """Reorder fmts so the one matching raw's shape is tried first."""
+    # Each strptime miss raises ValueError; guessing right avoids the misses.
+    month = raw.split(None, 1)[0]
+    if month.endswith("."):
+        guess = "%b. %d, %Y"
+    else:
+        month_fmt = "%B" if len(month) > 3 else "%b"
+        guess = f"{month_fmt} %d, %Y" if "," in raw else f"{month_fmt} %d %Y"
+    return [guess, *(f for f in fmts if f != guess)]
+
+
+def _numeric_date(raw: str, shape: str) -> str | None:
+    """Convert an ISO or MM/DD/YYYY string to YYYY-MM-DD without strptime."""
+    if shape == "iso":
+        year, month, day = raw.split("-")
+    else:
+        month, day, year = raw.split("/")
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+
+_CLIP_ID_RE = re.compile(r"clip_id=(\d+)")
+
+
 def _clip_id_from_url(url: str) -> str | None:
     """Extract the clip_id parameter from a Granicus URL."""
-    m = re.search(r"clip_id=(\d+)", url)
+    m = _CLIP_ID_RE.search(url)
     return m.group(1) if m else None
@@ -15,10 +15,17 @@ rather than just a link to a full meeting agenda PDF.
 
 import logging
 import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,17 @@ HEADERS = {
     )
 }
 
+# Shared keep-alive session: every call goes to webapi.legistar.com, so the
+# TLS handshake is paid once per pooled connection rather than per request.
+# Transient rate-limit and server errors are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
 # Matter types that map to dashboard categories
 MATTER_TYPE_CATEGORY = {
     "ordinance":        "hearing",
@@ -46,13 +64,19 @@ MATTER_TYPE_CATEGORY = {
     "right of way":     "road",
 }
 
+# Generic filler agenda items with no substantive content
+SKIP_TITLES = frozenset({
+    "roll call", "adjournment", "communications & receive/file",
+    "approval of minutes", "public comment", "open forum",
+})
+
 
 def fetch(config: dict) -> list[dict]:
     cfg = config["sources"]["legistar"]
     if not cfg.get("enabled", True):
         return []
 
-    geo = _build_geo_patterns(config)
+    geo = _build_geo_pattern(config)
     allowed_statuses = {s.lower() for s in cfg.get("agenda_statuses", ["Final", "Final-revised"])}
 
     # Date range
@@ -65,31 +89,39 @@ def fetch(config: dict) -> list[dict]:
     logger.info("Legistar: %d events in date range %s → %s", len(events), date_from, date_to)
 
     # ── Step 2: For each event with a published agenda, fetch items ───────────
-    all_items: list[dict] = []
+    agenda_events = []
     for event in events:
         agenda_status = (event.get("EventAgendaStatusName") or "").lower()
         if agenda_status not in allowed_statuses:
             logger.debug("Skipping event %s (%s) — agenda status: %s",
                          event.get("EventId"), event.get("EventBodyName"), agenda_status)
             continue
+        agenda_events.append(event)
 
-        event_id   = event["EventId"]
-        body_name  = event.get("EventBodyName", "Saint Paul Legistar")
-        event_date = _parse_event_date(event.get("EventDate", ""))
-        meeting_url = event.get("EventInSiteURL") or MEETING_DETAIL_URL.format(event_id=event_id)
-
-        items = _fetch_event_items(event_id)
-        if items is None:
-            # API error — skip this event but continue
-            continue
+    # Per-event calls are independent, so fan them out over a thread pool.
+    # The rate limiter caps request starts per second to stay polite to the
+    # API; results come back in event order.
+    limiter = _RateLimiter(cfg.get("requests_per_second", 4))
+    all_items: list[dict] = []
+    with ThreadPoolExecutor(max_workers=cfg.get("concurrency", 4)) as executor:
+        results = executor.map(
+            lambda event: _fetch_event_items(event["EventId"], limiter),
+            agenda_events,
+        )
+        for event, items in zip(agenda_events, results):
+            if items is None:
+                # API error — skip this event but continue
+                continue
 
-        for raw_item in items:
-            item = _process_item(raw_item, body_name, event_date, meeting_url, geo, cfg)
-            if item:
-                all_items.append(item)
+            event_id   = event["EventId"]
+            body_name  = event.get("EventBodyName", "Saint Paul Legistar")
+            event_date = _parse_event_date(event.get("EventDate", ""))
+            meeting_url = event.get("EventInSiteURL") or MEETING_DETAIL_URL.format(event_id=event_id)
 
-        # Be polite to the API — small delay between per-event calls
-        time.sleep(0.25)
+            for raw_item in items:
+                item = _process_item(raw_item, body_name, event_date, meeting_url, geo, cfg)
+                if item:
+                    all_items.append(item)
 
     logger.info("Legistar: %d geo-relevant items across all events", len(all_items))
     return all_items
@@ -97,6 +129,17 @@ def fetch(config: dict) -> list[dict]:
 
 # ── API calls ─────────────────────────────────────────────────────────────────
 
+# Only the fields fetch() and _process_item read — $select trims the payload
+# (and JSON decode work) on the server side.
+EVENT_FIELDS = (
+    "EventId", "EventBodyName", "EventDate", "EventAgendaStatusName", "EventInSiteURL",
+)
+EVENT_ITEM_FIELDS = (
+    "EventItemTitle", "EventItemMatterName", "EventItemMatterFile",
+    "EventItemMatterType", "EventItemMatterStatus", "EventItemAgendaNumber",
+)
+
+
 def _fetch_events(cfg: dict, date_from, date_to) -> list[dict]:
     """Fetch all events in the given date range."""
     url = f"{API_BASE}/events"
@@ -107,11 +150,12 @@ def _fetch_events(cfg: dict, date_from, date_to) -> list[dict]:
         ),
         "$orderby": "EventDate asc",
         "$top": 200,
+        "$select": ",".join(EVENT_FIELDS),
     }
     try:
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=30)
+        resp = _SESSION.get(url, params=params, timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
     except requests.RequestException as e:
         logger.error("Legistar events API error: %s", e)
         return []
@@ -120,13 +164,15 @@ def _fetch_events(cfg: dict, date_from, date_to) -> list[dict]:
         return []
 
 
-def _fetch_event_items(event_id: int) -> list[dict] | None:
+def _fetch_event_items(event_id: int, limiter: "_RateLimiter") -> list[dict] | None:
     """Fetch individual agenda items for one event. Returns None on error."""
     url = f"{API_BASE}/events/{event_id}/eventitems"
+    params = {"$select": ",".join(EVENT_ITEM_FIELDS)}
+    limiter.wait()
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = _SESSION.get(url, params=params, timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
     except requests.RequestException as e:
         logger.error("Legistar event items API error (event %s): %s", event_id, e)
         return None
@@ -135,6 +181,33 @@ def _fetch_event_items(event_id: int) -> list[dict] | None:
         return None
 
 
+class _RateLimiter:
+    """Allow at most `rate` request starts in any rolling `period` seconds.
+
+    Unlike a fixed sleep after each call, a request only waits when the
+    window is already full, so slow responses don't add idle time on top.
+    Safe to share across worker threads.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self.rate = max(1, rate)
+        self.period = period
+        self._lock = threading.Lock()
+        self._starts: deque[float] = deque()
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self.period:
+                    self._starts.popleft()
+                if len(self._starts) < self.rate:
+                    self._starts.append(now)
+                    return
+                delay = self._starts[0] + self.period - now
+            time.sleep(delay)
+
+
 # ── Item processing ───────────────────────────────────────────────────────────
 
 def _process_item(
@@ -149,28 +222,28 @@ def _process_item(
     Convert a raw Legistar event item into a dashboard item dict,
     or return None if the item should be skipped.
     """
+    # Cheapest rejections first — they need only the title and matter type
     title        = (raw.get("EventItemTitle") or "").strip()
-    matter_name  = (raw.get("EventItemMatterName") or "").strip()
-    matter_file  = (raw.get("EventItemMatterFile") or "").strip()
     matter_type  = (raw.get("EventItemMatterType") or "").strip()
-    matter_status = (raw.get("EventItemMatterStatus") or "").strip()
-    agenda_num   = raw.get("EventItemAgendaNumber")
 
     # Skip structural rows (roll call, section headers, adjournment)
     if not title or not matter_type:
         return None
 
     # Skip generic filler items with no substantive content
-    skip_titles = {"roll call", "adjournment", "communications & receive/file",
-                   "approval of minutes", "public comment", "open forum"}
-    if title.lower() in skip_titles:
+    if title.lower() in SKIP_TITLES:
         return None
 
     # ── Geographic filter ─────────────────────────────────────────────────────
+    matter_name  = (raw.get("EventItemMatterName") or "").strip()
     searchable = f"{title} {matter_name}"
     if not _geo_matches(searchable, geo):
         return None
 
+    matter_file  = (raw.get("EventItemMatterFile") or "").strip()
+    matter_status = (raw.get("EventItemMatterStatus") or "").strip()
+    agenda_num   = raw.get("EventItemAgendaNumber")
+
     # ── Build dashboard item ──────────────────────────────────────────────────
     # Always link to the meeting page — LegislationDetail URLs use an internal
     # ID scheme that doesn't match the API's EventItemMatterId, so the meeting
@@ -217,56 +290,62 @@ def _process_item(
 
 # ── Geographic matching ───────────────────────────────────────────────────────
 
-def _build_geo_patterns(config: dict) -> dict:
-    """Pre-compile regex patterns for geographic filtering."""
-    def make_pattern(terms):
-        if not terms:
-            return None
-        return re.compile(
-            r"\b(" + "|".join(re.escape(t) for t in terms) + r")\b",
-            re.IGNORECASE,
-        )
+def _build_geo_pattern(config: dict):
+    """Pre-compile one pattern matching any target ZIP, neighborhood, or corridor.
 
-    return {
-        "zip":          make_pattern(config.get("zip_codes", [])),
-        "neighborhood": make_pattern(config.get("neighborhoods", [])),
-        "corridor":     make_pattern(config.get("corridors", [])),
-    }
+    All three term lists are folded into a single alternation so each agenda
+    item is scanned once. Terms get the same suffix normalization as the text,
+    so a corridor written as "Selby Avenue" in config.yml still matches.
+    Returns None if no terms are configured.
+    """
+    terms = list(dict.fromkeys(
+        _normalize_suffixes(t).lower() for t in [
+            *config.get("zip_codes", []),
+            *config.get("neighborhoods", []),
+            *config.get("corridors", []),
+        ]
+    ))
+    if not terms:
+        return None
+    # Terms are lowercased here and the text in _geo_matches, so the pattern
+    # can match case-sensitively and skip per-character case folding.
+    return re.compile(r"\b(" + "|".join(re.escape(t) for t in terms) + r")\b")
 
 
-def _geo_matches(text: str, geo: dict) -> bool:
+@lru_cache(maxsize=4096)
+def _geo_matches(text: str, geo) -> bool:
     """Return True if the text mentions a target ZIP, neighborhood, or corridor.
 
     Normalizes street suffixes before matching so that government documents
     that spell out "Avenue", "Street", etc. match config entries like "Selby Ave".
+    Cached because the same matter often recurs across events (committee,
+    then Council); the compiled geo pattern is hashable and part of the key.
     """
-    normalized = _normalize_suffixes(text)
-    for pattern in geo.values():
-        if pattern and pattern.search(normalized):
-            return True
-    return False
+    if geo is None:
+        return False
+    return geo.search(_normalize_suffixes(text).lower()) is not None
 
 
 # Suffix normalization map: full form → abbreviation used in config.yml corridors
-_SUFFIX_MAP = [
-    (re.compile(r"\bAvenue\b",   re.IGNORECASE), "Ave"),
-    (re.compile(r"\bStreet\b",   re.IGNORECASE), "St"),
-    (re.compile(r"\bBoulevard\b",re.IGNORECASE), "Blvd"),
-    (re.compile(r"\bParkway\b",  re.IGNORECASE), "Pkwy"),
-    (re.compile(r"\bDrive\b",    re.IGNORECASE), "Dr"),
-    (re.compile(r"\bLane\b",     re.IGNORECASE), "Ln"),
-    (re.compile(r"\bCourt\b",    re.IGNORECASE), "Ct"),
-    (re.compile(r"\bCircle\b",   re.IGNORECASE), "Cir"),
-    (re.compile(r"\bPlace\b",    re.IGNORECASE), "Pl"),
-    (re.compile(r"\bRoad\b",     re.IGNORECASE), "Rd"),
-]
+_SUFFIX_MAP = {
+    "avenue":    "Ave",
+    "street":    "St",
+    "boulevard": "Blvd",
+    "parkway":   "Pkwy",
+    "drive":     "Dr",
+    "lane":      "Ln",
+    "court":     "Ct",
+    "circle":    "Cir",
+    "place":     "Pl",
+    "road":      "Rd",
+}
+# One alternation over every suffix, so normalization is a single pass
+_SUFFIX_RE = re.compile(r"\b(" + "|".join(_SUFFIX_MAP) + r")\b", re.IGNORECASE)
 
 
 def _normalize_suffixes(text: str) -> str:
     """Replace spelled-out street suffixes with standard abbreviations."""
-    for pattern, replacement in _SUFFIX_MAP:
-        text = pattern.sub(replacement, text)
-    return text
+    return _SUFFIX_RE.sub(lambda m: _SUFFIX_MAP[m.group(1).lower()], text)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -289,10 +368,13 @@ def _categorize(matter_type: str) -> str:
     return "hearing"
 
 
+_ADDRESS_RE = re.compile(
+    r"\b\d{2,5}\s+[A-Za-z][A-Za-z\s]+(Ave|St|Blvd|Dr|Rd|Pkwy|Ln|Way|Ct)\b",
+    re.IGNORECASE,
+)
+
+
 def _extract_address(text: str) -> str:
     """Pull a street address out of item text if present."""
-    m = re.search(
-        r"\b\d{2,5}\s+[A-Za-z][A-Za-z\s]+(Ave|St|Blvd|Dr|Rd|Pkwy|Ln|Way|Ct)\b",
-        text, re.IGNORECASE,
-    )
+    m = _ADDRESS_RE.search(text)
     return m.group(0) if m else ""